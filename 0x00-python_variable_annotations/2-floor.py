@@ -3,9 +3,9 @@
 A  type-annotated function floor which takes a float floorNumber as
 argument and returns the floor of the float.
 """
-import math
+from math import floor as _math_floor
 
 
 def floor(floorNumber: float) -> int:
     """ Returns a lower bound rounded figure of a float """
-    return math.floor(floorNumber)
+    return _math_floor(floorNumber)
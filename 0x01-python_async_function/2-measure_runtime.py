@@ -14,7 +14,14 @@ def measure_time(n: int, max_delay: int = 10) -> float:
     """
     returns total_time / n then takes max_delay as  input
     """
+    async def main() -> List[float]:
+        """ Runs wait_n with eager tasks where asyncio supports them """
+        eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+        if eager_task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_task_factory)
+        return await wait_n(n, max_delay)
+
     start_time = time.perf_counter()
-    asyncio.run(wait_n(n, max_delay))
+    asyncio.run(main())
     time_elapsed = time.perf_counter() - start_time
     return time_elapsed / n
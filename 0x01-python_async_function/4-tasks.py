@@ -13,5 +13,12 @@ async def task_wait_n(n: int, max_delay: int) -> List[float]:
     """
     Returns a list of delays and takes n and max_delay
     """
+    delays: List[float] = []
+
+    async def record_delay(task: Task) -> None:
+        """ Appends a delay as soon as its task completes """
+        delays.append(await task)
+
     todos = [task_wait_random(max_delay) for _ in range(n)]
-    return [await task for task in asyncio.as_completed(todos)]
+    await asyncio.gather(*(record_delay(todo) for todo in todos))
+    return delays
@@ -13,6 +13,8 @@ async def async_generator() -> Generator[float, None, None]:
     """
     Each time asynchronously wait 1 second
     """
-    for i in range(10):
-        await asyncio.sleep(1)
-        yield random.uniform(0, 10)
+    sleep = asyncio.sleep
+    uniform = random.uniform
+    for _ in range(10):
+        await sleep(1)
+        yield uniform(0, 10)
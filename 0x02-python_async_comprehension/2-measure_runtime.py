@@ -13,6 +13,5 @@ async_comprehension = __import__('1-async_comprehension').async_comprehension
 async def measure_runtime() -> float:
     """ Returns the total runtime"""
     start = time.perf_counter()
-    result = await asyncio.gather(*(async_comprehension() for _ in range(4)))
-    total = time.perf_counter() - start
-    return total
+    await asyncio.gather(*(async_comprehension() for _ in range(4)))
+    return time.perf_counter() - start